@@ -103,19 +103,15 @@ class cmd:
     dyaw = 0.0
 
 
-def get_servo_states(hal: HAL) -> tuple[list, list]:
+def get_servo_states(hal: HAL) -> tuple[np.ndarray, np.ndarray]:
     if MOCK:
-        return [0 for _ in range(10)], [0 for _ in range(10)]
-    
-    servo_positions = hal.servo.get_positions()
-    positions = [pos for _, pos, _ in servo_positions[:10]] 
-    velocities = [vel for _, _, vel in servo_positions[:10]]
+        return np.zeros(10, dtype=np.float32), np.zeros(10, dtype=np.float32)
 
-    positions = [math.radians(pos) for pos in positions]
+    # rows of (id, position_deg, velocity), reversed to policy joint order
+    servo_states = np.array(hal.servo.get_positions()[:10], dtype=np.double)[::-1]
+    positions = np.radians(servo_states[:, 1]).astype(np.float32)
+    velocities = servo_states[:, 2].astype(np.float32)
 
-    positions.reverse()
-    velocities.reverse()
-    
     print(f"[INFO]: GET servo positions (rad): {positions}")
     return positions, velocities
 
@@ -149,22 +145,22 @@ def inference(policy: ort.InferenceSession, hal: HAL, cfg: Sim2simCfg) -> None:
     target_q = np.zeros((cfg.num_actions), dtype=np.double)
     action = np.zeros((cfg.num_actions), dtype=np.double)
 
-    hist_obs = deque()
+    hist_obs = deque(maxlen=cfg.frame_stack)
     for _ in range(cfg.frame_stack):
         hist_obs.append(np.zeros([1, cfg.num_single_obs], dtype=np.double))
 
 
+    input_name = policy.get_inputs()[0].name
+
     target_frequency = 1 / (cfg.dt * cfg.decimation)  # 100 Hz
     target_loop_time = 1.0 / target_frequency  # 4 ms
 
     while True:
-        t = time.time()
-        loop_start_time = time.time()
+        loop_start_time = time.monotonic()
+        t = loop_start_time
 
         # get current positions
-        current_positions, current_velocities = get_servo_states(hal)
-        current_positions_np = np.array(current_positions, dtype=np.float32)
-        current_velocities_np = np.array(current_velocities, dtype=np.float32)
+        current_positions_np, current_velocities_np = get_servo_states(hal)
 
         # IMU mock
         omega = np.zeros(3, dtype=np.float32)
@@ -185,14 +181,11 @@ def inference(policy: ort.InferenceSession, hal: HAL, cfg: Sim2simCfg) -> None:
         obs[0, (3 * cfg.num_actions + 5) + 3 : (3 * cfg.num_actions + 5) + 2 * 3] = eu_ang
         obs = np.clip(obs, -cfg.clip_observations, cfg.clip_observations)
 
-        hist_obs.append(obs)
-        hist_obs.popleft()
+        hist_obs.append(obs)  # maxlen drops the oldest frame
 
-        policy_input = np.zeros([1, cfg.num_observations], dtype=np.float32)
-        for i in range(cfg.frame_stack):
-            policy_input[0, i * cfg.num_single_obs : (i + 1) * cfg.num_single_obs] = hist_obs[i][0, :]
+        policy_input = np.concatenate(hist_obs, axis=1, dtype=np.float32)
 
-        ort_inputs = {policy.get_inputs()[0].name: policy_input}
+        ort_inputs = {input_name: policy_input}
         action[:] = policy.run(None, ort_inputs)[0][0]
 
         action = np.clip(action, -cfg.clip_actions, cfg.clip_actions)
@@ -203,7 +196,7 @@ def inference(policy: ort.InferenceSession, hal: HAL, cfg: Sim2simCfg) -> None:
         set_servo_positions(command_positions, hal)
 
         # Calculate how long to sleep
-        loop_end_time = time.time()
+        loop_end_time = time.monotonic()
         loop_duration = loop_end_time - loop_start_time
         sleep_time = max(0, target_loop_time - loop_duration)
 